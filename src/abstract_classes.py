@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional
+from typing import List, Optional
 
 
 class BaseDice(ABC):
@@ -7,61 +7,79 @@ class BaseDice(ABC):
     def roll(self) -> int:
         ...
 
+    def roll_many(self, count: int) -> List[int]:
+        return [self.roll() for _ in range(count)]
+
 
 class BasePlayer(ABC):
+    __slots__ = ("amount", "position", "strategy")
     amount: int
     position: int
+    strategy: int
 
     @abstractmethod
     def should_buy(self, property: "BaseProperty") -> bool:
         ...
 
-    def has_amount_to_buy(self, property: "BaseProperty"):
+    def reset(self, amount: int) -> None:
+        self.amount = amount
+        self.position = 0
+
+    def has_amount_to_buy(self, property: "BaseProperty") -> bool:
         return self.amount >= property.price
 
-    def buy(self, property: "BaseProperty"):
-        if not property.is_available:
+    def buy(self, property: "BaseProperty") -> None:
+        if property.owner is not None:
             raise ValueError("Property is not available")
         if not self.has_amount_to_buy(property):
             raise ValueError("Player does not have enough amount")
         property.owner = self
         self.amount -= property.price
 
-    def pay_rent(self, property: "BaseProperty"):
+    def pay_rent(self, property: "BaseProperty") -> None:
+        if property.owner is None:
+            raise ValueError("Property has no owner")
         property.owner.amount += property.rent
         self.amount -= property.rent
 
     @property
-    def bankrupt(self):
+    def bankrupt(self) -> bool:
         return self.amount < 0
 
 
 class BaseProperty(ABC):
+    __slots__ = ("price", "rent", "owner")
     price: int
     rent: int
     owner: Optional[BasePlayer]
 
-    @property
-    @abstractmethod
-    def is_available(self) -> bool:
-        ...
-
-
-StrategyFunc = Callable[[BasePlayer, BaseProperty], bool]
-
 
 class BaseBoard(ABC):
-    properties: List[BaseProperty]
+    prices: List[int]
+    rents: List[int]
+    # index of the owner in `BaseGame.players`, -1 when unowned
+    owners: List[int]
+
+    @abstractmethod
+    def reset(self) -> None:
+        ...
 
 
 class BaseGame(ABC):
     board: BaseBoard
     dice: BaseDice
-    active_players: List[BasePlayer]
+    players: List[BasePlayer]
+    alive: List[bool]
+    # one pre-drawn roll per seat per round, read as `round * seats + seat`
+    dice_tape: List[int]
     round: int = 0
 
+    @property
+    def active_players(self) -> List[BasePlayer]:
+        return [p for p, alive in zip(self.players, self.alive) if alive]
+
     @abstractmethod
-    def setup():
+    def setup(self) -> None:
         ...
 
     @abstractmethod
@@ -69,29 +87,43 @@ class BaseGame(ABC):
         ...
 
     @abstractmethod
-    def move_player(self, player: BasePlayer):
+    def move_player(self, player: BasePlayer, dice_value: int) -> None:
         ...
 
     @abstractmethod
-    def execute_player_turn(self):
+    def execute_player_turn(self, player_idx: int) -> None:
         ...
 
     @abstractmethod
-    def on_player_bankrupt(self):
+    def on_player_bankrupt(self, player_idx: int) -> None:
         ...
 
     @abstractmethod
-    def finish(self):
+    def finish(self) -> None:
         ...
 
-    def play(self):
+    def play(self) -> None:
         self.setup()
-        while self.should_continue():
-            for player in self.active_players:
-                result = self.dice.roll()
-                self.move_player(player, result)
-                self.execute_player_turn(player)
+        # bind hot lookups once instead of resolving them on every turn
+        tape = self.dice_tape
+        move = self.move_player
+        turn = self.execute_player_turn
+        on_bankrupt = self.on_player_bankrupt
+        should_continue = self.should_continue
+        players = self.players
+        alive = self.alive
+        seats = len(players)
+        while should_continue():
+            offset = self.round * seats
+            for i, player in enumerate(players):
+                if not alive[i]:
+                    continue
+                move(player, tape[offset + i])
+                turn(i)
                 if player.bankrupt:
-                    self.on_player_bankrupt(player)
+                    on_bankrupt(i)
+                    # the last player standing has nothing left to play for
+                    if sum(alive) <= 1:
+                        break
             self.round += 1
         self.finish()
@@ -1,5 +1,6 @@
-import math
-from typing import List, Optional
+from dataclasses import dataclass
+from multiprocessing.pool import Pool
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple
 import random as rd
 
 from abstract_classes import (
@@ -8,182 +9,346 @@ from abstract_classes import (
     BaseGame,
     BasePlayer,
     BaseProperty,
-    StrategyFunc,
 )
 
+# buy rules get the generator's bound `random` method, not the generator
+BuyRule = Callable[[int, int, int, Callable[[], float]], bool]
 
-class Strategies:
-    """Definition of different strategies players can use"""
+# shared generator for everything that is not seeded explicitly
+_rng = rd.Random()
+
+
+# strategies players can use, as codes indexing `STRATEGY_NAMES`
+IMPULSIVE, DEMANDING, CAUTIOUS, RANDOM = range(4)
+STRATEGY_NAMES = ["Impulsive", "Demanding", "Cautious", "Random"]
+
+
+def _buys_impulsive(
+    amount: int, price: int, rent: int, random: Callable[[], float]
+) -> bool:
+    return True
+
+
+def _buys_demanding(
+    amount: int, price: int, rent: int, random: Callable[[], float]
+) -> bool:
+    return rent > 50
+
+
+def _buys_cautious(
+    amount: int, price: int, rent: int, random: Callable[[], float]
+) -> bool:
+    return amount - price >= 80
 
-    @staticmethod
-    def impulsive(player: "Player", property: "Property") -> bool:
-        return True
 
-    @staticmethod
-    def demanding(player: "Player", property: "Property") -> bool:
-        return property.rent > 50
+def _buys_random(
+    amount: int, price: int, rent: int, random: Callable[[], float]
+) -> bool:
+    return random() < 0.5
 
-    @staticmethod
-    def cautious(player: "Player", property: "Property") -> bool:
-        return player.amount - property.price >= 80
 
-    @staticmethod
-    def random(player: "Player", property: "Property") -> bool:
-        return rd.choice([True, False])
+# buy rule of each strategy, indexed by strategy code
+BUY_RULES: List[BuyRule] = [
+    _buys_impulsive,
+    _buys_demanding,
+    _buys_cautious,
+    _buys_random,
+]
+
+
+def should_buy(
+    strategy: int, amount: int, price: int, rent: int, random: Callable[[], float]
+) -> bool:
+    """Decide whether a player following `strategy` buys a property"""
+    return BUY_RULES[strategy](amount, price, rent, random)
 
 
 class Dice(BaseDice):
+    FACES: ClassVar[range] = range(1, 7)
+
+    def __init__(self, seed: Optional[int] = None, batch: int = 4096) -> None:
+        self._rng = _rng if seed is None else rd.Random(seed)
+        self._batch = batch
+        self._buf: List[int] = []
+        self._i = batch
+
+    def _refill(self) -> None:
+        # one draw per batch instead of one randint call per roll
+        self._buf = self._rng.choices(self.FACES, k=self._batch)
+        self._i = 0
+
     def roll(self) -> int:
-        return rd.randint(1, 6)
+        if self._i == self._batch:
+            self._refill()
+        value = self._buf[self._i]
+        self._i += 1
+        return value
+
+    def roll_many(self, count: int) -> List[int]:
+        return self._rng.choices(self.FACES, k=count)
 
 
 class Player(BasePlayer):
-    INITIAL_AMOUNT: int = 300
+    __slots__ = ()
+    INITIAL_AMOUNT: ClassVar[int] = 300
 
-    def __init__(self, should_buy: StrategyFunc) -> None:
-        self._should_buy = should_buy
-        self.amount = self.INITIAL_AMOUNT
+    def __init__(self, strategy: int) -> None:
+        self.strategy = strategy
+        self.reset(self.INITIAL_AMOUNT)
 
-    def should_buy(self, property: "BaseProperty"):
-        return self._should_buy(self, property)
+    def should_buy(self, property: "BaseProperty") -> bool:
+        return should_buy(
+            self.strategy, self.amount, property.price, property.rent, _rng.random
+        )
 
 
 class Property(BaseProperty):
-    def __init__(self, price: int):
+    __slots__ = ()
+
+    def __init__(self, price: int) -> None:
         self.price = price
         self.rent = int(0.1 * price)
         self.owner = None
 
-    @property
-    def is_available(self):
-        return self.owner is None
-
 
 class Board(BaseBoard):
-    MIN_PROP_PRICE: int = 100
-    MAX_PROP_PRICE: int = 250
-    PROP_COUNT: int = 20
-
-    def __init__(self):
-        self.properties = [
-            Property(rd.randint(self.MIN_PROP_PRICE, self.MAX_PROP_PRICE))
-            for _ in range(0, self.PROP_COUNT)
-        ]
+    MIN_PROP_PRICE: ClassVar[int] = 100
+    MAX_PROP_PRICE: ClassVar[int] = 250
+    PROP_COUNT: ClassVar[int] = 20
+
+    def __init__(
+        self, prices: Optional[List[int]] = None, rng: Optional[rd.Random] = None
+    ) -> None:
+        if prices is None:
+            prices = self._draw_prices(rng or _rng, self.PROP_COUNT)
+        # one list per field instead of one object per property
+        self.prices = list(prices)
+        self.rents = [int(0.1 * price) for price in self.prices]
+        self.owners = [-1] * len(self.prices)
+
+    def _draw_prices(self, rng: rd.Random, count: int) -> List[int]:
+        return rng.choices(range(self.MIN_PROP_PRICE, self.MAX_PROP_PRICE + 1), k=count)
+
+    def reset(self, rng: Optional[rd.Random] = None) -> None:
+        """Clear every owner in place; when given `rng`, also draw new prices"""
+        if rng is not None:
+            self.prices[:] = self._draw_prices(rng, len(self.prices))
+            self.rents[:] = [int(0.1 * price) for price in self.prices]
+        self.owners[:] = [-1] * len(self.owners)
 
 
 class Game(BaseGame):
     winner: Optional[BasePlayer] = None
     timeout: bool = False
-    MAX_ROUNDS = 1000
-    INITIAL_AMOUNT = 300
-    PRIZE_ON_ROUND_COMPLETION = 100
-
-    def __init__(self, board, dice, players: List[BasePlayer]) -> None:
+    MAX_ROUNDS: ClassVar[int] = 1000
+    INITIAL_AMOUNT: ClassVar[int] = 300
+    PRIZE_ON_ROUND_COMPLETION: ClassVar[int] = 100
+
+    def __init__(
+        self,
+        board: BaseBoard,
+        dice: BaseDice,
+        players: List[BasePlayer],
+        rng: Optional[rd.Random] = None,
+    ) -> None:
         self.board = board
         self.dice = dice
         self.players = players
+        self.rng = rng or _rng
         self.winner = None
+        self._property_count = len(board.prices)
 
-    @property
-    def property_count(self):
-        return len(self.board.properties)
-
-    def setup(self):
+    def setup(self) -> None:
         for p in self.players:
-            p.amount = self.INITIAL_AMOUNT
-            p.position = 0
-        rd.shuffle(self.players)
-        self.active_players = self.players
+            p.reset(self.INITIAL_AMOUNT)
+        # boards may be reused between games, so drop the previous owners
+        self.board.reset()
+        self.rng.shuffle(self.players)
+        self.alive = [True] * len(self.players)
+        self.dice_tape = self.dice.roll_many(self.MAX_ROUNDS * len(self.players))
+        # resolve each seat's rule once so turns skip the strategy dispatch
+        self.buy_rules: List[BuyRule] = [BUY_RULES[p.strategy] for p in self.players]
+        self._random = self.rng.random
         self.winner = None
 
-    def on_player_bankrupt(self, player: BasePlayer):
-        self.active_players.remove(player)
-        for prop in self.board.properties:
-            if prop.owner == player:
-                prop.owner = None
-
-    def on_player_round_completion(self, player: BasePlayer):
-        player.amount += self.PRIZE_ON_ROUND_COMPLETION
-
-    def move_player(self, player: BasePlayer, dice_value: int):
-        if player.position + dice_value >= self.property_count:
-            player.position = (player.position + dice_value) % self.property_count
-            for _ in range(
-                0, math.floor((player.position + dice_value) / self.property_count) + 1
-            ):
-                self.on_player_round_completion(player)
-        else:
-            player.position += dice_value
-
-    def execute_player_turn(self, player: BasePlayer):
-        target_property = self.board.properties[player.position]
-        if target_property.is_available:
-            if player.has_amount_to_buy(target_property) and player.should_buy(
-                target_property
+    def on_player_bankrupt(self, player_idx: int) -> None:
+        self.alive[player_idx] = False
+        owners = self.board.owners
+        owners[:] = [-1 if owner == player_idx else owner for owner in owners]
+
+    def on_player_round_completion(self, player: BasePlayer, laps: int = 1) -> None:
+        player.amount += laps * self.PRIZE_ON_ROUND_COMPLETION
+
+    def move_player(self, player: BasePlayer, dice_value: int) -> None:
+        laps, player.position = divmod(
+            player.position + dice_value, self._property_count
+        )
+        if laps:
+            self.on_player_round_completion(player, laps)
+
+    def execute_player_turn(self, player_idx: int) -> None:
+        board = self.board
+        player = self.players[player_idx]
+        position = player.position
+        owner = board.owners[position]
+        if owner < 0:
+            price = board.prices[position]
+            if player.amount >= price and self.buy_rules[player_idx](
+                player.amount, price, board.rents[position], self._random
             ):
-                player.buy(target_property)
+                # same as `BasePlayer.buy`, whose checks were just done above
+                board.owners[position] = player_idx
+                player.amount -= price
         else:
-            player.pay_rent(target_property)
+            # same as `BasePlayer.pay_rent`
+            rent = board.rents[position]
+            self.players[owner].amount += rent
+            player.amount -= rent
 
-    def should_continue(self):
-        if len(self.active_players) == 1:
+    def should_continue(self) -> bool:
+        if sum(self.alive) == 1:
             return False
         if self.round >= self.MAX_ROUNDS:
             self.timeout = True
             return False
         return True
 
-    def finish(self):
-        if len(self.active_players) == 1:
-            self.winner = self.active_players[0]
+    def finish(self) -> None:
+        active_players = self.active_players
+        if len(active_players) == 1:
+            self.winner = active_players[0]
         else:
-            self.active_players.sort(key=lambda p: p.amount, reverse=True)
-            if self.active_players[0].amount == self.active_players[1].amount:
-                # in case of two or more tied players...
-                tied_players = [
-                    p
-                    for p in self.active_players
-                    if p.amount == self.active_players[0].amount
-                ]
-                # untie by initial player order
-                tied_players.sort(key=lambda p: self.players.index(p))
-                self.winner = tied_players[0]
-            else:
-                self.winner = self.active_players[0]
-
-
-def run_simulation():
+            # active players are listed in initial order and max() keeps the
+            # first of equal amounts, which unties by initial player order
+            self.winner = max(active_players, key=lambda p: p.amount)
+
+
+def print_results(
+    games_count: int, timeouts: int, total_rounds: int, wins: Dict[str, int]
+) -> None:
+    print(f"{timeouts} games finished by timeout (out of {games_count})")
+    print(f"Average round number: {total_rounds / games_count:.1f}")
+    print("Victory rate by player behaviour: ")
+    for name, winners in wins.items():
+        print(f"{name.title()}: {winners / games_count:.1%}")
+
+
+@dataclass(slots=True)
+class GameResult:
+    """What a finished game contributes to the simulation results"""
+
+    winner_code: int
+    rounds: int
+    timeout: bool
+
+
+def _run_game(
+    prices: List[int],
+    rents: List[int],
+    seats: List[int],
+    tape: List[int],
+    random: Callable[[], float],
+) -> Tuple[int, int, bool]:
+    """Play a single game over local ints, following the same rules as `Game`.
+
+    `seats` maps turn order to a strategy code and `tape` holds one roll per
+    seat per round, read like `BaseGame.dice_tape`. Everything the loop
+    touches is a local variable, so no attribute lookups happen per turn.
+    Returns the winner's strategy code, the round count and the timeout flag.
+    """
+    property_count = len(prices)
+    players_count = len(seats)
+    max_rounds = Game.MAX_ROUNDS
+    prize = Game.PRIZE_ON_ROUND_COMPLETION
+    buy_rules = [BUY_RULES[strategy] for strategy in seats]
+    positions = [0] * players_count
+    amounts = [Game.INITIAL_AMOUNT] * players_count
+    alive = [True] * players_count
+    owners = [-1] * property_count
+    remaining = players_count
+    rounds = 0
+
+    while remaining > 1 and rounds < max_rounds:
+        offset = rounds * players_count
+        for p in range(players_count):
+            if not alive[p]:
+                continue
+            laps, here = divmod(positions[p] + tape[offset + p], property_count)
+            positions[p] = here
+            amount = amounts[p] + laps * prize
+            owner = owners[here]
+            if owner == -1:
+                price = prices[here]
+                if amount >= price and buy_rules[p](amount, price, rents[here], random):
+                    owners[here] = p
+                    amount -= price
+            elif owner != p:
+                # `amount` is written back below, so rent to oneself is skipped
+                amounts[owner] += rents[here]
+                amount -= rents[here]
+            amounts[p] = amount
+            if amount < 0:
+                alive[p] = False
+                remaining -= 1
+                for i in range(property_count):
+                    if owners[i] == p:
+                        owners[i] = -1
+                # same early exit as `BaseGame.play`
+                if remaining <= 1:
+                    break
+        rounds += 1
+
+    # richest active player wins, ties broken by turn order
+    winner = max(
+        (p for p in range(players_count) if alive[p]),
+        key=lambda p: (amounts[p], -p),
+    )
+    return seats[winner], rounds, remaining > 1
+
+
+def _simulate_one(seed: int) -> GameResult:
+    """Play one game from its own seed and keep only its result.
+
+    Randomness is drawn in the same order as `Game.setup`, so the kernel
+    plays the exact game a `Game` built from the same seed would.
+    """
+    rng = rd.Random(seed)
+    board = Board(rng=rng)
+    dice = Dice(rng.getrandbits(64))
+    seats = [IMPULSIVE, DEMANDING, CAUTIOUS, RANDOM]
+    rng.shuffle(seats)
+    tape = dice.roll_many(Game.MAX_ROUNDS * len(seats))
+    winner, rounds, timeout = _run_game(
+        board.prices, board.rents, seats, tape, rng.random
+    )
+    return GameResult(winner_code=winner, rounds=rounds, timeout=timeout)
+
+
+def run_simulation(pool: Optional[Pool] = None) -> None:
+    """Run the games across processes; pass `pool` to reuse one between calls"""
     ITERATIONS_TO_RUN = 300
 
-    board = Board()
-    dice = Dice()
-    games: List[Game] = []
-
-    for _ in range(0, ITERATIONS_TO_RUN):
-        players = [
-            Player(Strategies.impulsive),
-            Player(Strategies.demanding),
-            Player(Strategies.cautious),
-            Player(Strategies.random),
-        ]
-        game = Game(board, dice, players)
-        game.play()
-        games.append(game)
-
-    # Calculate and display results
-    games_finished_by_timeout = len([g for g in games if g.timeout])
-    avg_rounds = sum([g.round for g in games]) / len(games)
-    print(
-        f"{games_finished_by_timeout} games finished by timeout (out of {len(games)})"
+    seeds = [_rng.getrandbits(64) for _ in range(ITERATIONS_TO_RUN)]
+    if pool is None:
+        with Pool() as pool:
+            results = list(pool.imap_unordered(_simulate_one, seeds, chunksize=32))
+    else:
+        results = list(pool.imap_unordered(_simulate_one, seeds, chunksize=32))
+
+    # Calculate and display results in a single pass
+    games_finished_by_timeout = 0
+    total_rounds = 0
+    wins = [0] * len(STRATEGY_NAMES)
+    for result in results:
+        games_finished_by_timeout += result.timeout
+        total_rounds += result.rounds
+        wins[result.winner_code] += 1
+    print_results(
+        len(results),
+        games_finished_by_timeout,
+        total_rounds,
+        dict(zip(STRATEGY_NAMES, wins)),
     )
-    print(f"Average round number: {avg_rounds:.1f}")
-    print("Victory rate by player behaviour: ")
-    for s in Strategies.__dict__.values():
-        if isinstance(s, staticmethod):
-            winners = len(
-                [g for g in games if g.winner._should_buy.__name__ == str(s.__name__)]
-            )
-            print(f"{str(s.__name__).title()}: {winners / len(games):.1%}")
 
 
 if __name__ == "__main__":
@@ -1,19 +1,34 @@
 from io import StringIO
-import random as rd
+from multiprocessing import Pool
 from random import Random
 import sys
 import unittest
-from unittest.mock import patch
-
-from game import Board, Dice, Game, Strategies, Player, Property, run_simulation
+from unittest.mock import Mock, patch
+
+from game import (
+    BUY_RULES,
+    CAUTIOUS,
+    DEMANDING,
+    IMPULSIVE,
+    RANDOM,
+    Board,
+    Dice,
+    Game,
+    GameResult,
+    Player,
+    Property,
+    _run_game,
+    _simulate_one,
+    run_simulation,
+)
 
 
 class TestPlayerBuyBehaviour(unittest.TestCase):
     def setUp(self):
-        self.impulsive_player = Player(Strategies.impulsive)
-        self.picky_player = Player(Strategies.demanding)
-        self.cautious_player = Player(Strategies.cautious)
-        self.random_player = Player(Strategies.random)
+        self.impulsive_player = Player(IMPULSIVE)
+        self.picky_player = Player(DEMANDING)
+        self.cautious_player = Player(CAUTIOUS)
+        self.random_player = Player(RANDOM)
 
     def test_impulsive_player(self):
         for i in [0, 100, 200, 1000]:
@@ -28,22 +43,26 @@ class TestPlayerBuyBehaviour(unittest.TestCase):
         self.assertTrue(self.cautious_player.should_buy(Property(220)))
         self.assertFalse(self.cautious_player.should_buy(Property(221)))
 
-    @patch("game.rd")
-    def test_random_player(self, rd: rd):
+    @patch("game._rng", Random(42))
+    def test_random_player(self):
         # force random to be deterministic
-        rd.choice._mock_side_effect = Random(42).choice
+        self.assertFalse(self.random_player.should_buy(Property(100)))
         self.assertTrue(self.random_player.should_buy(Property(100)))
         self.assertTrue(self.random_player.should_buy(Property(100)))
-        self.assertFalse(self.random_player.should_buy(Property(100)))
 
 
 class TestPlayerActions(unittest.TestCase):
     def setUp(self):
-        self.player = Player(Strategies.impulsive)
-        owner = Player(Strategies.impulsive)
+        self.player = Player(IMPULSIVE)
+        owner = Player(IMPULSIVE)
         self.property = Property(100)
         self.property.owner = owner
 
+    def test_player_and_property_should_not_carry_instance_dict(self):
+        self.assertFalse(hasattr(self.player, "__dict__"))
+        self.assertFalse(hasattr(self.property, "__dict__"))
+        self.assertEqual(self.player.position, 0)
+
     def test_has_amount_to_buy(self):
         self.player.amount = 100
         self.assertTrue(self.player.has_amount_to_buy(Property(100)))
@@ -76,24 +95,126 @@ class TestPlayerActions(unittest.TestCase):
         self.assertEqual(self.property.owner.amount, 310)
 
 
+class TestDice(unittest.TestCase):
+    def test_roll_should_stay_within_faces(self):
+        dice = Dice(seed=42, batch=8)
+        rolls = [dice.roll() for _ in range(100)]
+        self.assertTrue(all(1 <= r <= 6 for r in rolls))
+        self.assertEqual(set(rolls), {1, 2, 3, 4, 5, 6})
+
+    def test_roll_with_same_seed_should_repeat(self):
+        first, second = Dice(seed=42, batch=8), Dice(seed=42, batch=8)
+        self.assertEqual(
+            [first.roll() for _ in range(20)], [second.roll() for _ in range(20)]
+        )
+
+    def test_roll_many_should_match_single_rolls(self):
+        first, second = Dice(seed=42, batch=8), Dice(seed=42, batch=8)
+        self.assertEqual(first.roll_many(8), [second.roll() for _ in range(8)])
+
+
+class TestBoard(unittest.TestCase):
+    def setUp(self):
+        self.board = Board([100, 200])
+
+    def test_board_should_generate_prices_within_range(self):
+        board = Board(rng=Random(42))
+        self.assertEqual(len(board.prices), Board.PROP_COUNT)
+        for price, rent in zip(board.prices, board.rents):
+            self.assertGreaterEqual(price, Board.MIN_PROP_PRICE)
+            self.assertLessEqual(price, Board.MAX_PROP_PRICE)
+            self.assertEqual(rent, Property(price).rent)
+        self.assertEqual(board.owners, [-1] * Board.PROP_COUNT)
+
+    def test_reset_should_clear_owners_in_place(self):
+        owners = self.board.owners
+        owners[0] = 2
+        self.board.reset()
+        self.assertIs(self.board.owners, owners)
+        self.assertEqual(owners, [-1, -1])
+        self.assertEqual(self.board.prices, [100, 200])
+
+    def test_reset_with_rng_should_draw_new_prices(self):
+        board = Board(rng=Random(1))
+        prices = board.prices
+        board.reset(Random(2))
+        self.assertIs(board.prices, prices)
+        self.assertEqual(board.prices, Board(rng=Random(2)).prices)
+        self.assertEqual(board.rents, [Property(p).rent for p in board.prices])
+
+
 class TestGameRules(unittest.TestCase):
     def setUp(self):
-        self.p1 = Player(Strategies.impulsive)
-        self.p2 = Player(Strategies.demanding)
-        self.p3 = Player(Strategies.cautious)
-        self.p4 = Player(Strategies.random)
+        self.p1 = Player(IMPULSIVE)
+        self.p2 = Player(DEMANDING)
+        self.p3 = Player(CAUTIOUS)
+        self.p4 = Player(RANDOM)
         self.board = Board()
         self.dice = Dice()
 
-    @patch("game.rd")
-    def test_setup_should_randomize_player_order(self, rd):
+    def test_setup_should_randomize_player_order(self):
         # force random to be deterministic
-        rd.shuffle._mock_side_effect = Random(42).shuffle
-        game = Game(self.board, self.dice, [self.p1, self.p2, self.p3, self.p4])
+        game = Game(
+            self.board, self.dice, [self.p1, self.p2, self.p3, self.p4], Random(42)
+        )
         game.setup()
         self.assertEqual(game.active_players, [self.p3, self.p2, self.p4, self.p1])
         self.assertEqual(game.players, game.active_players)
 
+    def test_setup_should_draw_one_roll_per_seat_and_round(self):
+        players = [self.p1, self.p2, self.p3, self.p4]
+        game = Game(self.board, Dice(seed=42), players)
+        game.setup()
+        self.assertEqual(len(game.dice_tape), game.MAX_ROUNDS * len(players))
+        self.assertTrue(all(1 <= roll <= 6 for roll in game.dice_tape))
+
+    def test_play_should_read_rolls_from_dice_tape(self):
+        players = [self.p1, self.p2, self.p3, self.p4]
+        board = Board([10**9] * 20)
+        game = Game(board, self.dice, players)
+        tape = [1] * len(players) * game.MAX_ROUNDS
+        with (
+            patch.object(self.dice, "roll_many", return_value=tape),
+            patch.object(self.dice, "roll") as mock_roll,
+        ):
+            game.play()
+            mock_roll.assert_not_called()
+        for p in game.players:
+            self.assertEqual(p.position, game.MAX_ROUNDS % len(board.prices))
+
+    def test_setup_should_resolve_buy_rule_per_seat(self):
+        players = [self.p1, self.p2, self.p3, self.p4]
+        game = Game(self.board, self.dice, players)
+        game.setup()
+        self.assertEqual(game.buy_rules, [BUY_RULES[p.strategy] for p in game.players])
+
+    def test_setup_should_clear_previous_owners(self):
+        players = [self.p1, self.p2, self.p3, self.p4]
+        self.board.owners[0] = 3
+        game = Game(self.board, self.dice, players)
+        game.setup()
+        self.assertEqual(self.board.owners, [-1] * len(self.board.prices))
+
+    def test_play_should_stop_the_round_when_one_player_is_left(self):
+        players = [self.p1, self.p2, self.p3, self.p4]
+        game = Game(self.board, self.dice, players)
+
+        def bankrupt_first_three(player_idx):
+            if player_idx < 3:
+                game.players[player_idx].amount = -1
+
+        with patch.object(
+            game, "execute_player_turn", side_effect=bankrupt_first_three
+        ) as mock_turn:
+            game.play()
+            self.assertEqual(
+                [c.args for c in mock_turn.call_args_list], [(0,), (1,), (2,)]
+            )
+        self.assertEqual(game.players[3].position, 0)
+        self.assertEqual(game.round, 1)
+        self.assertFalse(game.timeout)
+        self.assertIs(game.winner, game.players[3])
+
     def test_setup_should_reset_position(self):
         players = [self.p1, self.p2, self.p3, self.p4]
         for p in players:
@@ -118,6 +239,8 @@ class TestGameRules(unittest.TestCase):
         game = Game(self.board, self.dice, players)
         game.on_player_round_completion(self.p1)
         self.assertEqual(self.p1.amount, 10 + game.PRIZE_ON_ROUND_COMPLETION)
+        game.on_player_round_completion(self.p1, 2)
+        self.assertEqual(self.p1.amount, 10 + 3 * game.PRIZE_ON_ROUND_COMPLETION)
 
     def test_move_player_should_set_to_new_position(self):
         self.p1.position = 0
@@ -125,6 +248,7 @@ class TestGameRules(unittest.TestCase):
         game = Game(self.board, self.dice, players)
         game.move_player(self.p1, 6)
         self.assertEqual(self.p1.position, 6)
+        self.assertEqual(self.p1.amount, self.p1.INITIAL_AMOUNT)
 
     def test_move_player_should_call_on_player_round_completion(self):
         self.p1.position = 19
@@ -132,118 +256,119 @@ class TestGameRules(unittest.TestCase):
         game = Game(self.board, self.dice, players)
         with patch.object(game, "on_player_round_completion") as mock:
             game.move_player(self.p1, 1)
-            mock.assert_called_once_with(self.p1)
+            mock.assert_called_once_with(self.p1, 1)
         self.assertEqual(self.p1.position, 0)
 
-    def test_move_player_should_call_on_player_round_completion_more_than_once(self):
+    def test_move_player_should_pay_every_lap_completed_at_once(self):
         """This use case will not happen, but it is a good test to ensure different dice ranges"""
         self.p1.position = 9
         players = [self.p1, self.p2, self.p3, self.p4]
-        short_board = Board()
-        short_board.properties = short_board.properties[:10]
-        game = Game(self.board, self.dice, players)
+        short_board = Board(self.board.prices[:10])
+        game = Game(short_board, self.dice, players)
         with patch.object(game, "on_player_round_completion") as mock:
             game.move_player(self.p1, 19)
-            mock.assert_called_with(self.p1)
-            self.assertEqual(mock.call_count, 2)
+            mock.assert_called_once_with(self.p1, 2)
         self.assertEqual(self.p1.position, 8)
 
     def test_execute_player_turn_with_available_property_and_enough_amount_should_use_strategy(
         self,
     ):
         players = [self.p1, self.p2, self.p3, self.p4]
-        board = Board()
-        board.properties = [Property(100)]
+        board = Board([100])
         game = Game(board, self.dice, players)
         game.setup()
         game.move_player(self.p1, 1)
-        target_property = board.properties[self.p1.position]
-        self.assertTrue(target_property.is_available)
-        self.assertTrue(self.p1.has_amount_to_buy(target_property))
-
-        with (
-            patch.object(self.p1, "should_buy") as mock_should_buy,
-            patch.object(self.p1, "buy") as mock_buy,
-        ):
-            # will buy when should_buy is True
+        p1_idx = game.players.index(self.p1)
+        position = self.p1.position
+        amount = self.p1.amount
+        self.assertEqual(board.owners[position], -1)
+        self.assertGreaterEqual(amount, board.prices[position])
+
+        with patch.object(game, "buy_rules", [Mock()] * 4):
+            # will buy when the seat's buy rule is True
+            mock_should_buy = game.buy_rules[0]
             mock_should_buy.return_value = True
-            game.execute_player_turn(self.p1)
-            mock_should_buy.assert_called_once_with(target_property)
-            mock_buy.assert_called_once_with(target_property)
-        with (
-            patch.object(self.p1, "should_buy") as mock_should_buy,
-            patch.object(self.p1, "buy") as mock_buy,
-        ):
-            # will not buy when should_buy is False
+            game.execute_player_turn(p1_idx)
+            mock_should_buy.assert_called_once_with(
+                amount,
+                board.prices[position],
+                board.rents[position],
+                game.rng.random,
+            )
+            self.assertEqual(board.owners[position], p1_idx)
+            self.assertEqual(self.p1.amount, amount - board.prices[position])
+        board.owners[position] = -1
+        self.p1.amount = amount
+        with patch.object(game, "buy_rules", [Mock()] * 4):
+            # will not buy when the seat's buy rule is False
+            mock_should_buy = game.buy_rules[0]
             mock_should_buy.return_value = False
-            game.execute_player_turn(self.p1)
-            mock_should_buy.assert_called_once_with(target_property)
-            mock_buy.assert_not_called()
+            game.execute_player_turn(p1_idx)
+            mock_should_buy.assert_called_once_with(
+                amount,
+                board.prices[position],
+                board.rents[position],
+                game.rng.random,
+            )
+            self.assertEqual(board.owners[position], -1)
+            self.assertEqual(self.p1.amount, amount)
 
     def test_execute_player_turn_with_available_property_and_not_enough_amount_should_do_nothing(
         self,
     ):
         players = [self.p1, self.p2, self.p3, self.p4]
-        board = Board()
-        board.properties = [Property(1000)]
+        board = Board([1000])
         game = Game(board, self.dice, players)
         game.setup()
         game.move_player(self.p1, 1)
-        target_property = board.properties[self.p1.position]
-        self.assertTrue(target_property.is_available)
-        self.assertFalse(self.p1.has_amount_to_buy(target_property))
+        position = self.p1.position
+        amount = self.p1.amount
+        self.assertEqual(board.owners[position], -1)
+        self.assertLess(amount, board.prices[position])
 
-        with (
-            patch.object(self.p1, "should_buy") as mock_should_buy,
-            patch.object(self.p1, "buy") as mock_buy,
-            patch.object(self.p1, "pay_rent") as mock_pay_rent,
-        ):
-            game.execute_player_turn(self.p1)
-            mock_should_buy.assert_not_called()
-            mock_buy.assert_not_called()
-            mock_pay_rent.assert_not_called()
+        with patch.object(game, "buy_rules", [Mock()] * 4):
+            game.execute_player_turn(game.players.index(self.p1))
+            game.buy_rules[0].assert_not_called()
+        self.assertEqual(board.owners[position], -1)
+        self.assertEqual(self.p1.amount, amount)
 
     def test_execute_player_turn_with_unavailable_property_should_pay_rent(self):
         players = [self.p1, self.p2, self.p3, self.p4]
-        board = Board()
-        owned_property = Property(100)
-        owned_property.owner = self.p2
-        board.properties = [owned_property]
+        board = Board([100])
         game = Game(board, self.dice, players)
         game.setup()
+        board.owners[0] = game.players.index(self.p2)
         game.move_player(self.p1, 1)
-        target_property = board.properties[self.p1.position]
-        self.assertFalse(target_property.is_available)
+        position = self.p1.position
+        amount, owner_amount = self.p1.amount, self.p2.amount
+        self.assertGreaterEqual(board.owners[position], 0)
 
-        with (
-            patch.object(self.p1, "should_buy") as mock_should_buy,
-            patch.object(self.p1, "buy") as mock_buy,
-            patch.object(self.p1, "pay_rent") as mock_pay_rent,
-        ):
-            game.execute_player_turn(self.p1)
-            mock_should_buy.assert_not_called()
-            mock_buy.assert_not_called()
-            mock_pay_rent.assert_called_once_with(target_property)
+        with patch.object(game, "buy_rules", [Mock()] * 4):
+            game.execute_player_turn(game.players.index(self.p1))
+            game.buy_rules[0].assert_not_called()
+        self.assertEqual(board.owners[position], game.players.index(self.p2))
+        self.assertEqual(self.p1.amount, amount - board.rents[position])
+        self.assertEqual(self.p2.amount, owner_amount + board.rents[position])
 
     def test_on_player_bankrupt_should_remove_and_expropriate_player(self):
         players = [self.p1, self.p2, self.p3, self.p4]
-        board = Board()
-        owned_property = Property(100)
-        owned_property.owner = self.p1
-        board.properties = [owned_property]
+        board = Board([100, 100])
         game = Game(board, self.dice, players)
         game.setup()
-        game.on_player_bankrupt(self.p1)
-        self.assertIsNone(owned_property.owner)
+        board.owners[0] = game.players.index(self.p1)
+        board.owners[1] = game.players.index(self.p2)
+        game.on_player_bankrupt(game.players.index(self.p1))
+        self.assertEqual(board.owners, [-1, game.players.index(self.p2)])
         self.assertNotIn(self.p1, game.active_players)
+        self.assertFalse(game.alive[game.players.index(self.p1)])
 
     def test_finish_with_one_active_player_as_winner(self):
         players = [self.p1, self.p2, self.p3, self.p4]
         game = Game(self.board, self.dice, players)
         game.setup()
-        game.on_player_bankrupt(self.p1)
-        game.on_player_bankrupt(self.p2)
-        game.on_player_bankrupt(self.p3)
+        game.on_player_bankrupt(game.players.index(self.p1))
+        game.on_player_bankrupt(game.players.index(self.p2))
+        game.on_player_bankrupt(game.players.index(self.p3))
         game.finish()
         self.assertEqual(game.active_players, [self.p4])
         self.assertEqual(game.winner, self.p4)
@@ -252,8 +377,8 @@ class TestGameRules(unittest.TestCase):
         players = [self.p1, self.p2, self.p3, self.p4]
         game = Game(self.board, self.dice, players)
         game.setup()
-        game.on_player_bankrupt(self.p1)
-        game.on_player_bankrupt(self.p2)
+        game.on_player_bankrupt(game.players.index(self.p1))
+        game.on_player_bankrupt(game.players.index(self.p2))
         self.p3.amount = 100
         self.p4.amount = 1000
         game.finish()
@@ -268,10 +393,11 @@ class TestGameRules(unittest.TestCase):
         initial_order = game.players.copy()
         initial_order.remove(self.p1)
         initial_order.remove(self.p2)
-        game.on_player_bankrupt(self.p1)
+        game.on_player_bankrupt(game.players.index(self.p1))
         self.p2.amount = 10
         game.finish()
-        self.assertEqual(game.active_players[0].amount, game.active_players[1].amount)
+        amounts = sorted((p.amount for p in game.active_players), reverse=True)
+        self.assertEqual(amounts[0], amounts[1])
         self.assertEqual(game.winner, initial_order[0])
 
     def test_finish_with_three_tied_players_should_also_break_tie_by_initial_order(
@@ -282,7 +408,7 @@ class TestGameRules(unittest.TestCase):
         game.setup()
         initial_order = game.players.copy()
         initial_order.remove(self.p1)
-        game.on_player_bankrupt(self.p1)
+        game.on_player_bankrupt(game.players.index(self.p1))
         game.finish()
         for player in game.active_players:
             self.assertEqual(player.amount, game.active_players[0].amount)
@@ -297,7 +423,8 @@ class TestGameRules(unittest.TestCase):
     def test_should_continue_when_only_one_player_should_be_false(self):
         players = [self.p1, self.p2, self.p3, self.p4]
         game = Game(self.board, self.dice, players)
-        game.active_players = [self.p1]
+        game.setup()
+        game.alive = [True, False, False, False]
         self.assertFalse(game.should_continue())
 
     def test_should_continue_when_round_max_out_should_be_false(self):
@@ -307,19 +434,74 @@ class TestGameRules(unittest.TestCase):
         game.round = game.MAX_ROUNDS
         self.assertFalse(game.should_continue())
 
-    @patch("game.rd")
-    def test_play_with_fixed_seed_should_succeed(self, rnd):
-        rnd.randint._mock_side_effect = Random(42).randint
-        rnd.shuffle._mock_side_effect = Random(42).shuffle
-        rd.seed(42)
+    @patch("game._rng", Random(42))
+    def test_play_with_fixed_seed_should_succeed(self):
         players = [self.p1, self.p2, self.p3, self.p4]
-        game = Game(Board(), Dice(), players)
+        game = Game(Board(rng=Random(42)), Dice(seed=42), players, Random(42))
         game.setup()
         game.play()
         self.assertEqual(game.round, game.MAX_ROUNDS)
         self.assertIs(game.winner, self.p4)
 
 
+class TestRunGame(unittest.TestCase):
+    def test_run_game_without_purchases_should_timeout_and_break_tie_by_order(self):
+        prices = [10**9] * 20
+        rents = [100] * 20
+        winner, rounds, timeout = _run_game(
+            prices, rents, [2, 0, 3, 1], [1] * Game.MAX_ROUNDS * 4, lambda: 0.0
+        )
+        self.assertEqual(winner, 2)
+        self.assertEqual(rounds, Game.MAX_ROUNDS)
+        self.assertTrue(timeout)
+
+    def test_run_game_should_end_when_one_player_is_left(self):
+        # seat 0 buys everything, everyone else pays rent until bankrupt
+        prices = [100] * 20
+        rents = [200] * 20
+        winner, rounds, timeout = _run_game(
+            prices, rents, [0, 1, 2, 3], [1] * Game.MAX_ROUNDS * 4, lambda: 0.9
+        )
+        self.assertEqual(winner, 0)
+        self.assertLess(rounds, Game.MAX_ROUNDS)
+        self.assertFalse(timeout)
+
+    def _play_both(self, prices, rents, seed):
+        board = Board(prices)
+        board.rents[:] = rents
+        players = [
+            Player(IMPULSIVE),
+            Player(DEMANDING),
+            Player(CAUTIOUS),
+            Player(RANDOM),
+        ]
+        game = Game(board, Dice(seed), players, Random(seed))
+        game.play()
+        # replay the seat shuffle of `Game.setup` to reach the same random state
+        rng = Random(seed)
+        rng.shuffle(list(players))
+        seats = [p.strategy for p in game.players]
+        result = _run_game(prices, rents, seats, game.dice_tape, rng.random)
+        self.assertEqual(result, (game.winner.strategy, game.round, game.timeout))
+
+    def test_run_game_should_match_game_on_default_boards(self):
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                prices = Board(rng=Random(seed)).prices
+                self._play_both(prices, [int(0.1 * p) for p in prices], seed)
+
+    def test_run_game_should_match_game_when_landing_on_own_property(self):
+        # few squares and rents above every balance, so owners land on their
+        # own squares often and a wrongly charged rent would bankrupt them
+        for seed in range(200):
+            with self.subTest(seed=seed):
+                rng = Random(seed)
+                count = rng.randint(2, 6)
+                prices = [rng.randint(1, 50) for _ in range(count)]
+                rents = [rng.randint(150, 400) for _ in range(count)]
+                self._play_both(prices, rents, seed)
+
+
 class TestRunSimulation(unittest.TestCase):
     def setUp(self) -> None:
         self.output = StringIO()
@@ -328,16 +510,33 @@ class TestRunSimulation(unittest.TestCase):
     def tearDown(self) -> None:
         sys.stdout = sys.__stdout__
 
+    @patch("game._rng", Random(42))
     def test_run_simulation(self):
-        rd.seed(42)
         run_simulation()
         printed_text = self.output.getvalue().split("\n")
-        self.assertIn("300 games finished by timeout (out of 300)", printed_text)
-        self.assertIn("Average round number: 1000.0", printed_text)
-        self.assertIn("Impulsive: 23.3%", printed_text)
-        self.assertIn("Demanding: 31.7%", printed_text)
-        self.assertIn("Cautious: 24.0%", printed_text)
-        self.assertIn("Random: 21.0%", printed_text)
+        self.assertIn("299 games finished by timeout (out of 300)", printed_text)
+        self.assertIn("Average round number: 999.6", printed_text)
+        self.assertIn("Impulsive: 49.0%", printed_text)
+        self.assertIn("Demanding: 0.0%", printed_text)
+        self.assertIn("Cautious: 34.0%", printed_text)
+        self.assertIn("Random: 17.0%", printed_text)
+
+    def test_simulate_one_should_only_return_game_result(self):
+        result = _simulate_one(42)
+        self.assertIsInstance(result, GameResult)
+        self.assertIn(result.winner_code, [IMPULSIVE, DEMANDING, CAUTIOUS, RANDOM])
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertEqual(result, _simulate_one(42))
+
+    def test_run_simulation_with_pool_should_match_own_pool(self):
+        with patch("game._rng", Random(42)):
+            run_simulation()
+        expected = self.output.getvalue()
+        self.output.seek(0)
+        self.output.truncate()
+        with patch("game._rng", Random(42)), Pool(2) as pool:
+            run_simulation(pool)
+        self.assertEqual(self.output.getvalue(), expected)
 
 
 if __name__ == "__main__":